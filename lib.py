@@ -2,16 +2,17 @@
 # SPDX-FileCopyrightText: 2013-2022 Campbell Barton
 # SPDX-FileCopyrightText: 2016-2025 Mikhail Rachinskiy
 
-import array
-import random
-from collections.abc import Iterator, MutableSequence
+import math
+import os
+import threading
+from collections.abc import Sequence
 
 import bmesh
 import bpy
 import mathutils
-from bmesh.types import BMesh, BMFace
-from bpy.types import Object
-from mathutils import Vector
+import numpy as np
+from bmesh.types import BMesh
+from bpy.types import Mesh, Object
 
 
 def clean_float(value: float, precision: int = 0) -> str:
@@ -33,45 +34,6 @@ def clean_float(value: float, precision: int = 0) -> str:
 # -------------------------------------
 
 
-def bmesh_copy_from_object(obj: Object, transform=True, triangulate=True, apply_modifiers=False) -> BMesh:
-    """Returns a transformed, triangulated copy of the mesh"""
-
-    assert obj.type == "MESH"
-
-    if apply_modifiers and obj.modifiers:
-        depsgraph = bpy.context.evaluated_depsgraph_get()
-        obj_eval = obj.evaluated_get(depsgraph)
-        me = obj_eval.to_mesh()
-        bm = bmesh.new()
-        bm.from_mesh(me)
-        obj_eval.to_mesh_clear()
-    else:
-        me = obj.data
-        if obj.mode == "EDIT":
-            bm_orig = bmesh.from_edit_mesh(me)
-            bm = bm_orig.copy()
-        else:
-            bm = bmesh.new()
-            bm.from_mesh(me)
-
-    # TODO. remove all customdata layers.
-    # would save ram
-
-    if transform:
-        mat = obj.matrix_world.copy()
-        # Avoid floating-point error when object is far away from scene center
-        mat.translation.zero()
-        if not mat.is_identity:
-            bm.transform(mat)
-            # Update normals if matrix has no rotation.
-            bm.normal_update()
-
-    if triangulate:
-        bmesh.ops.triangulate(bm, faces=bm.faces)
-
-    return bm
-
-
 def bmesh_from_object(obj: Object) -> BMesh:
     """Object/Edit Mode get mesh, use bmesh_to_object() to write back."""
     me = obj.data
@@ -96,121 +58,432 @@ def bmesh_to_object(obj: Object, bm: BMesh) -> None:
         me.update()
 
 
-def bmesh_calc_area(bm: BMesh) -> float:
-    """Calculate the surface area."""
-    return sum(f.calc_area() for f in bm.faces)
+def mesh_tris_world(obj: Object) -> np.ndarray:
+    """Returns triangle corner coordinates of the evaluated mesh in world space, translation is ignored."""
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    obj_eval = obj.evaluated_get(depsgraph)
+    me = obj_eval.to_mesh()
 
+    me.calc_loop_triangles()
+    # Read in the native float32 layout for a flat copy, sums need float64 precision
+    coords = _foreach_get(me.vertices, "co", np.float32, 3).astype(np.float64)
+    tris = _foreach_get(me.loop_triangles, "vertices", np.int32, 3)
 
-def bmesh_check_self_intersect_object(obj: Object) -> MutableSequence[int]:
-    """Check if any faces self intersect returns an array of edge index values."""
+    obj_eval.to_mesh_clear()
 
-    if not obj.data.polygons:
-        return array.array("i", ())
+    mat = obj.matrix_world.to_3x3()
+    if not mat.is_identity:
+        coords = coords @ np.array(mat).T
 
-    bm = bmesh_copy_from_object(obj, transform=False, triangulate=False)
-    tree = mathutils.bvhtree.BVHTree.FromBMesh(bm, epsilon=0.00001)
-    overlap = tree.overlap(tree)
-    faces_error = {i for i_pair in overlap for i in i_pair}
+    return coords[tris]
 
-    return array.array("i", faces_error)
 
+def calc_volume(tris: np.ndarray, signed=False) -> float:
+    """Calculate the volume enclosed by triangles."""
+    volume = np.einsum("ij,ij->", tris[:, 0], np.cross(tris[:, 1], tris[:, 2])) / 6.0
+    return float(volume if signed else abs(volume))
 
-def _bmesh_face_points_random(f: BMFace, num_points=1, margin=0.05) -> Iterator[Vector]:
-    # for pradictable results
-    random.seed(f.index)
 
-    uniform_args = 0.0 + margin, 1.0 - margin
-    vecs = [v.co for v in f.verts]
+def calc_area(tris: np.ndarray) -> float:
+    """Calculate the surface area of triangles."""
+    cross = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    return float(np.sqrt(np.einsum("ij,ij->i", cross, cross)).sum() / 2.0)
 
-    for _ in range(num_points):
-        u1 = random.uniform(*uniform_args)
-        u2 = random.uniform(*uniform_args)
-        u_tot = u1 + u2
 
-        if u_tot > 1.0:
-            u1 = 1.0 - u1
-            u2 = 1.0 - u2
+# Mesh Arrays
+# -------------------------------------
 
-        side1 = vecs[1] - vecs[0]
-        side2 = vecs[2] - vecs[0]
 
-        yield vecs[0] + u1 * side1 + u2 * side2
+def mesh_from_object(obj: Object) -> Mesh:
+    """Object/Edit Mode get mesh data, element indices match the edit-mesh."""
+    if obj.mode == "EDIT":
+        obj.update_from_editmode()
 
+    return obj.data
 
-def bmesh_check_thick_object(obj: Object, thickness: float) -> MutableSequence[int]:
-    # Triangulate
-    bm = bmesh_copy_from_object(obj, transform=True, triangulate=False)
 
-    # map original faces to their index.
-    face_index_map_org = {f: i for i, f in enumerate(bm.faces)}
-    ret = bmesh.ops.triangulate(bm, faces=bm.faces)
-    face_map = ret["face_map"]
-    del ret
-    # old edge -> new mapping
+def _index_array(mask: np.ndarray) -> np.ndarray:
+    return np.flatnonzero(mask).astype(np.int32)
 
-    # Convert new/old map to index dict.
 
-    # Create a real mesh (lame!)
-    context = bpy.context
-    layer = context.view_layer
-    scene_collection = context.layer_collection.collection
+def _foreach_get(seq, attr: str, dtype, size: int = 1) -> np.ndarray:
+    buf = np.empty(len(seq) * size, dtype=dtype)
+    seq.foreach_get(attr, buf)
+    return buf if size == 1 else buf.reshape(-1, size)
 
-    me_tmp = bpy.data.meshes.new(name="~temp~")
-    bm.to_mesh(me_tmp)
-    obj_tmp = bpy.data.objects.new(name=me_tmp.name, object_data=me_tmp)
-    scene_collection.objects.link(obj_tmp)
 
-    layer.update()
-    ray_cast = obj_tmp.ray_cast
+_scratch_local = threading.local()
+_SCRATCH_MAX_BYTES = 1 << 22
 
-    EPS_BIAS = 0.0001
 
-    faces_error = set()
-    bm_faces_new = bm.faces[:]
+def _scratch(name: str, size: int, dtype) -> np.ndarray:
+    """Returns a reusable per-thread buffer with undefined contents, for temporary arrays only.
 
-    for f in bm_faces_new:
-        no = f.normal
-        no_sta = no * EPS_BIAS
-        no_end = no * thickness
-        for p in _bmesh_face_points_random(f, num_points=6):
-            # Cast the ray backwards
-            p_a = p - no_sta
-            p_b = p - no_end
-            p_dir = p_b - p_a
+    Buffers larger than _SCRATCH_MAX_BYTES are allocated per call and not kept.
+    """
+    dtype = np.dtype(dtype)
+    if size * dtype.itemsize > _SCRATCH_MAX_BYTES:
+        return np.empty(size, dtype=dtype)
 
-            ok, _co, no, index = ray_cast(p_a, p_dir, distance=p_dir.length)
+    pool = _scratch_local.__dict__
+    key = name, dtype.char
+    buf = pool.get(key)
 
-            if ok:
-                # Add the face we hit
-                for f_iter in (f, bm_faces_new[index]):
-                    # if the face wasn't triangulated, just use existing
-                    f_org = face_map.get(f_iter, f_iter)
-                    f_org_index = face_index_map_org[f_org]
-                    faces_error.add(f_org_index)
+    if buf is None or len(buf) < size:
+        # Grow geometrically to amortize allocations for meshes of varying size
+        size_alloc = size if buf is None else min(max(size, 2 * len(buf)), _SCRATCH_MAX_BYTES // dtype.itemsize)
+        buf = pool[key] = np.empty(size_alloc, dtype=dtype)
+
+    return buf[:size]
+
+
+def scratch_clear() -> None:
+    """Release scratch buffers of the calling thread."""
+    _scratch_local.__dict__.clear()
+
+
+class _cached_property:
+    """Same as functools.cached_property without its lock.
+
+    Until Python 3.12 the lock is shared by all instances, which serializes
+    prefetch workers computing the same property for different meshes.
+    """
+
+    def __init__(self, func) -> None:
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        value = instance.__dict__[self.name] = self.func(instance)
+        return value
+
+
+class MeshArrays:
+    """Mesh data read with foreach_get, shared by geometry checks.
+
+    Arrays are read on first access, so a single check only pays for the data it uses.
+    World space arrays are transformed by object matrix, translation is ignored.
+    """
+
+    def __init__(self, obj: Object) -> None:
+        self.me = mesh_from_object(obj)
+        self.matrix = obj.matrix_world.to_3x3()
+
+    @_cached_property
+    def coords(self) -> np.ndarray:
+        return _foreach_get(self.me.vertices, "co", np.float32, 3)
+
+    @_cached_property
+    def coords_world(self) -> np.ndarray:
+        if self.matrix.is_identity:
+            return self.coords
+        return self.coords @ np.array(self.matrix, dtype=np.float32).T
+
+    @_cached_property
+    def edge_verts(self) -> np.ndarray:
+        return _foreach_get(self.me.edges, "vertices", np.int32, 2)
+
+    @_cached_property
+    def loop_verts(self) -> np.ndarray:
+        return _foreach_get(self.me.loops, "vertex_index", np.int32)
+
+    @_cached_property
+    def loop_edges(self) -> np.ndarray:
+        return _foreach_get(self.me.loops, "edge_index", np.int32)
+
+    @_cached_property
+    def loop_start(self) -> np.ndarray:
+        return _foreach_get(self.me.polygons, "loop_start", np.int32)
+
+    @_cached_property
+    def loop_total(self) -> np.ndarray:
+        return _foreach_get(self.me.polygons, "loop_total", np.int32)
+
+    @_cached_property
+    def loop_cycle(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Polygon, next and previous loop index for each loop."""
+        loop_start = self.loop_start
+        loop_poly = np.repeat(np.arange(len(loop_start), dtype=np.int32), self.loop_total)
+        loop_last = loop_start + self.loop_total - 1
 
-    bm.free()
+        loop_next = np.arange(1, len(loop_poly) + 1, dtype=np.int32)
+        loop_next[loop_last] = loop_start
+        loop_prev = np.arange(-1, len(loop_poly) - 1, dtype=np.int32)
+        loop_prev[loop_start] = loop_last
+
+        return loop_poly, loop_next, loop_prev
+
+    @_cached_property
+    def poly_areas(self) -> np.ndarray:
+        return _foreach_get(self.me.polygons, "area", np.float32)
+
+    @_cached_property
+    def poly_normals(self) -> np.ndarray:
+        return _foreach_get(self.me.polygon_normals, "vector", np.float32, 3)
+
+    @_cached_property
+    def poly_normals_world(self) -> np.ndarray:
+        normals = self.poly_normals
+
+        if not self.matrix.is_identity:
+            # Cofactor matrix, transforms normals same as recalculating them from transformed geometry
+            col_x, col_y, col_z = np.array(self.matrix, dtype=np.float32).T
+            cofactor = np.column_stack((np.cross(col_y, col_z), np.cross(col_z, col_x), np.cross(col_x, col_y)))
+            normals = normals @ cofactor.T
+
+            lengths = np.sqrt(np.einsum("ij,ij->i", normals, normals))
+            np.divide(normals, lengths[:, None], out=normals, where=lengths[:, None] > 0.0)
 
-    scene_collection.objects.unlink(obj_tmp)
-    bpy.data.objects.remove(obj_tmp)
-    bpy.data.meshes.remove(me_tmp)
+        return normals
 
-    layer.update()
+    @_cached_property
+    def loop_tris(self) -> tuple[np.ndarray, np.ndarray]:
+        """Vertex indices and polygon index of each loop triangle."""
+        self.me.calc_loop_triangles()
+        tris = _foreach_get(self.me.loop_triangles, "vertices", np.int32, 3)
+        tri_polys = _foreach_get(self.me.loop_triangles, "polygon_index", np.int32)
+        return tris, tri_polys
+
+    @_cached_property
+    def bvh(self) -> mathutils.bvhtree.BVHTree:
+        """World space BVH tree of loop triangles, hit index is loop triangle index."""
+        tris, _ = self.loop_tris
+        return mathutils.bvhtree.BVHTree.FromPolygons(
+            self.coords_world.tolist(),
+            tris.tolist(),
+            all_triangles=True,
+            epsilon=0.00001,
+        )
+
+    @_cached_property
+    def manifold_edge_loops(self) -> tuple[np.ndarray, np.ndarray]:
+        """Manifold edge mask and loop pairs of manifold edges in ascending edge order."""
+        loop_edges = self.loop_edges
+        is_manifold = np.bincount(loop_edges, minlength=len(self.edge_verts)) == 2
+
+        loops = np.flatnonzero(is_manifold[loop_edges])
+        loops = loops[np.argsort(loop_edges[loops], kind="stable")].reshape(-1, 2)
+
+        return is_manifold, loops
+
+    @_cached_property
+    def edge_lengths_sq(self) -> np.ndarray:
+        coords = self.coords
+        edge_verts = self.edge_verts
+        edge_vecs = coords[edge_verts[:, 1]] - coords[edge_verts[:, 0]]
+        return np.einsum("ij,ij->i", edge_vecs, edge_vecs)
+
+    @_cached_property
+    def poly_corner_cos_sq_min(self) -> np.ndarray:
+        """Smallest squared cosine between corner and face normal for each face, -1.0 for zero area faces."""
+        loop_start = self.loop_start
+        loop_poly, loop_next, loop_prev = self.loop_cycle
+        # Squared terms scale with edge length to the 8th power, float32 over/underflows
+        co_loop = self.coords_world[self.loop_verts].astype(np.float64)
+
+        poly_no = calc_poly_normals(co_loop, loop_poly, loop_next, loop_start)
+        poly_len_sq = np.einsum("ij,ij->i", poly_no, poly_no)
+
+        vec_prev = co_loop[loop_prev] - co_loop
+        vec_next = co_loop[loop_next] - co_loop
+        loop_no = np.cross(vec_prev, vec_next)
+        loop_len_sq = np.einsum("ij,ij->i", loop_no, loop_no)
+
+        # Co-linear corners use face normal, compared squared to avoid square roots
+        is_colinear = loop_len_sq <= 1e-10 * (
+            np.einsum("ij,ij->i", vec_prev, vec_prev) * np.einsum("ij,ij->i", vec_next, vec_next)
+        )
+
+        loop_dot = np.einsum("ij,ij->i", loop_no, poly_no[loop_poly])
+        loop_len_sq *= poly_len_sq[loop_poly]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            loop_cos_sq = np.divide(loop_dot * loop_dot, loop_len_sq, out=loop_dot, where=~is_colinear)
+
+        loop_cos_sq[is_colinear] = 1.0
+        cos_sq_min = np.minimum.reduceat(loop_cos_sq, loop_start) if len(loop_start) else loop_cos_sq[:0]
+
+        # Zero area faces have no valid normal
+        cos_sq_min[poly_len_sq == 0.0] = -1.0
+
+        return cos_sq_min
+
+    @_cached_property
+    def edge_cos_convex(self) -> np.ndarray:
+        """Face angle cosine of convex manifold edges, NaN for concave and non-manifold edges."""
+        loop_edges = self.loop_edges
+        loop_verts = self.loop_verts
+        loop_poly, loop_next, _loop_prev = self.loop_cycle
+        is_manifold, loops = self.manifold_edge_loops
 
-    return array.array("i", faces_error)
+        coords = self.coords_world
+        normals = self.poly_normals_world
+
+        loop_a, loop_b = loops.T
+        no_a = normals[loop_poly[loop_a]]
+        no_b = normals[loop_poly[loop_b]]
+        edge_dir = coords[loop_verts[loop_next[loop_a]]] - coords[loop_verts[loop_a]]
 
+        # Same as BMEdge.calc_face_angle_signed(), concave edges have negative angle
+        is_convex = np.einsum("ij,ij->i", np.cross(no_a, no_b), edge_dir) > 0.0
 
-def face_is_distorted(face: BMFace, angle: float) -> bool:
-    face_no = face.normal
-    get_angle = face_no.angle
+        edge_cos = np.full(len(is_manifold), np.nan, dtype=np.float32)
+        edge_cos[loop_edges[loop_a[is_convex]]] = np.einsum("ij,ij->i", no_a[is_convex], no_b[is_convex])
 
-    for loop in face.loops:
-        loop_no = loop.calc_normal()
+        return edge_cos
 
-        if loop_no.dot(face_no) < 0.0:
-            loop_no.negate()
 
-        # For some reason Split Non-Planar Faces operator calculates 2x angle
-        if (get_angle(loop_no, 1000.0) * 2.0) > angle:
-            return True
+def prefetch_mesh_arrays(arrays_seq: Sequence[MeshArrays], max_workers: int = 4) -> None:
+    """Read all mesh data, then compute derived arrays of every mesh in worker threads.
+
+    Mesh data is only accessed from the calling thread, NumPy releases the GIL for the rest.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    for arrays in arrays_seq:
+        for name in (
+            "coords_world",
+            "edge_verts",
+            "loop_verts",
+            "loop_edges",
+            "loop_start",
+            "loop_total",
+            "poly_areas",
+            "poly_normals",
+        ):
+            getattr(arrays, name)
+
+    stages = (
+        ("loop_cycle", "manifold_edge_loops", "poly_normals_world", "edge_lengths_sq"),
+        ("poly_corner_cos_sq_min", "edge_cos_convex"),
+    )
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, os.cpu_count() or 1)) as executor:
+        for names in stages:
+            futures = [executor.submit(getattr, arrays, name) for arrays in arrays_seq for name in names]
+            for future in futures:
+                future.result()
+
+
+def calc_poly_normals(co_loop: np.ndarray, loop_poly: np.ndarray, loop_next: np.ndarray, loop_start: np.ndarray) -> np.ndarray:
+    """Returns unnormalized polygon normals (Newell's method), length is twice the polygon area."""
+    # Relative to the first corner to avoid precision loss away from the origin
+    co_rel = co_loop - co_loop[loop_start[loop_poly]]
+    cross = np.cross(co_rel, co_rel[loop_next])
+
+    normals = np.empty((len(loop_start), 3), dtype=co_loop.dtype)
+    for i in range(3):
+        normals[:, i] = np.bincount(loop_poly, weights=cross[:, i], minlength=len(loop_start))
+
+    return normals
+
+
+def mesh_check_solid(arrays: MeshArrays) -> tuple[np.ndarray, np.ndarray]:
+    """Check for non-manifold and non-contiguous edges, returns arrays of edge index values."""
+    loop_edges = arrays.loop_edges
+    loop_verts = arrays.loop_verts
+    is_manifold, loops = arrays.manifold_edge_loops
+
+    # Manifold edge is contiguous when its two loops run in opposite directions
+    is_non_contig = np.zeros(len(is_manifold), dtype=bool)
+    is_non_contig[loop_edges[loops[:, 0]]] = loop_verts[loops[:, 0]] == loop_verts[loops[:, 1]]
+
+    return _index_array(~is_manifold), _index_array(is_non_contig)
+
+
+def mesh_check_degenerate(arrays: MeshArrays, threshold: float) -> tuple[np.ndarray, np.ndarray]:
+    """Check for zero area faces and zero length edges, returns arrays of face and edge index values."""
+    return _index_array(arrays.poly_areas <= threshold), _index_array(arrays.edge_lengths_sq <= threshold ** 2.0)
+
+
+def mesh_check_nonplanar(arrays: MeshArrays, angle: float) -> np.ndarray:
+    """Check for non-flat faces, returns an array of face index values."""
+    # For some reason Split Non-Planar Faces operator calculates 2x angle
+    return _index_array(arrays.poly_corner_cos_sq_min < math.cos(angle / 2.0) ** 2.0)
+
+
+def mesh_check_sharp(arrays: MeshArrays, angle: float) -> np.ndarray:
+    """Check for convex edges sharper than the angle, returns an array of edge index values."""
+    # Compare cosines to skip arccos, angle is within [0, pi]
+    with np.errstate(invalid="ignore"):
+        return _index_array(arrays.edge_cos_convex < math.cos(angle))
+
+
+def mesh_check_overhang(arrays: MeshArrays, angle: float) -> np.ndarray:
+    """Check for faces within the angle to the down axis, returns an array of face index values."""
+    if angle <= 0.0:
+        return np.empty(0, dtype=np.int32)
+
+    normals = arrays.poly_normals_world
+
+    # Any face facing down, skip trigonometry for horizontal limit
+    if math.isclose(angle, math.pi / 2.0):
+        return _index_array(normals[:, 2] < 0.0)
+
+    # Dot product with the down axis, zero length normals are ignored
+    return _index_array(-normals[:, 2] > math.cos(angle))
+
+
+def mesh_check_intersect(arrays: MeshArrays) -> np.ndarray:
+    if not len(arrays.me.polygons):
+        return np.empty(0, dtype=np.int32)
+
+    _, tri_polys = arrays.loop_tris
+    overlap = arrays.bvh.overlap(arrays.bvh)
+
+    faces_error = _scratch("faces_error", len(arrays.me.polygons), bool)
+    faces_error[:] = False
+    faces_error[tri_polys[np.array(overlap, dtype=np.int32).ravel()]] = True
+
+    return _index_array(faces_error)
+
+
+def mesh_check_thick(arrays: MeshArrays, thickness: float, num_points: int = 6, margin: float = 0.05) -> np.ndarray:
+    if not len(arrays.me.polygons):
+        return np.empty(0, dtype=np.int32)
+
+    EPS_BIAS = 0.0001
+
+    tris, tri_polys = arrays.loop_tris
+    co_a, co_b, co_c = arrays.coords_world[tris].transpose(1, 0, 2)
+    side1 = co_b - co_a
+    side2 = co_c - co_a
+
+    normals = np.cross(side1, side2)
+    lengths = np.sqrt(np.einsum("ij,ij->i", normals, normals))
+    valid = lengths > 0.0
+    normals[valid] /= lengths[valid, None]
+
+    # Random points inside each triangle, seeded for predictable results
+    rng = np.random.default_rng(0)
+    u = rng.uniform(margin, 1.0 - margin, (len(tris), num_points, 2)).astype(np.float32)
+    flip = u.sum(axis=2) > 1.0
+    u[flip] = 1.0 - u[flip]
+    points = co_a[:, None] + u[..., :1] * side1[:, None] + u[..., 1:] * side2[:, None]
+
+    # Cast the rays backwards
+    points -= normals[:, None] * EPS_BIAS
+    directions = -normals
+    distance = thickness - EPS_BIAS
+
+    faces_error = _scratch("faces_error", len(arrays.me.polygons), bool)
+    faces_error[:] = False
+    ray_cast = arrays.bvh.ray_cast
+
+    for i in np.flatnonzero(valid).tolist():
+        direction = directions[i].tolist()
+        for p in points[i].tolist():
+            _co, _no, index, _dist = ray_cast(p, direction, distance)
+
+            if index is not None:
+                # Add the face we hit
+                faces_error[tri_polys[i]] = True
+                faces_error[tri_polys[index]] = True
 
-    return False
+    return _index_array(faces_error)
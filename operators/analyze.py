@@ -2,43 +2,75 @@
 # SPDX-FileCopyrightText: 2013-2022 Campbell Barton
 # SPDX-FileCopyrightText: 2016-2025 Mikhail Rachinskiy
 
+import functools
 import math
 
-import bmesh
 import bpy
-from bmesh.types import BMEdge, BMFace, BMVert
 from bpy.app.translations import pgettext_tip as tip_
 from bpy.props import IntProperty
-from bpy.types import Object, Operator
+from bpy.types import Object, Operator, UnitSettings
 from mathutils import Euler, Matrix, Vector
 
 from .. import report
 
 
+_HALF_PI = math.pi / 2.0
+
+_UNITS = {
+    "METRIC": {
+        "KILOMETERS": (1000.0, "km"),
+        "METERS": (1.0, "m"),
+        "CENTIMETERS": (0.01, "cm"),
+        "MILLIMETERS": (0.001, "mm"),
+        "MICROMETERS": (0.000001, "µm"),
+    },
+    "IMPERIAL": {
+        "MILES": (1609.344, "mi"),
+        "FEET": (0.3048, "\'"),
+        "INCHES": (0.0254, "\""),
+        "THOU": (0.0000254, "thou"),
+    },
+}
+_UNITS_FALLBACK = {
+    "METRIC": _UNITS["METRIC"]["CENTIMETERS"],
+    "IMPERIAL": _UNITS["IMPERIAL"]["INCHES"],
+}
+
+
 def _get_unit(unit_system: str, unit: str) -> tuple[float, str]:
     # Returns unit length relative to meter and unit symbol
 
-    units = {
-        "METRIC": {
-            "KILOMETERS": (1000.0, "km"),
-            "METERS": (1.0, "m"),
-            "CENTIMETERS": (0.01, "cm"),
-            "MILLIMETERS": (0.001, "mm"),
-            "MICROMETERS": (0.000001, "µm"),
-        },
-        "IMPERIAL": {
-            "MILES": (1609.344, "mi"),
-            "FEET": (0.3048, "\'"),
-            "INCHES": (0.0254, "\""),
-            "THOU": (0.0000254, "thou"),
-        },
-    }
+    return _UNITS[unit_system].get(unit, _UNITS_FALLBACK[unit_system])
+
+
+def _volume_info(volume: float, unit: UnitSettings) -> tuple[str, None]:
+    from .. import lib
+
+    if unit.system == "NONE":
+        volume_fmt = lib.clean_float(volume, 8)
+    else:
+        length, symbol = _get_unit(unit.system, unit.length_unit)
+
+        volume_unit = volume * (unit.scale_length ** 3.0) / (length ** 3.0)
+        volume_str = lib.clean_float(volume_unit, 4)
+        volume_fmt = f"{volume_str} {symbol}"
+
+    return tip_("Volume: {}³").format(volume_fmt), None
+
 
-    try:
-        return units[unit_system][unit]
-    except KeyError:
-        fallback_unit = "CENTIMETERS" if unit_system == "METRIC" else "INCHES"
-        return units[unit_system][fallback_unit]
+def _area_info(area: float, unit: UnitSettings) -> tuple[str, None]:
+    from .. import lib
+
+    if unit.system == "NONE":
+        area_fmt = lib.clean_float(area, 8)
+    else:
+        length, symbol = _get_unit(unit.system, unit.length_unit)
+
+        area_unit = area * (unit.scale_length ** 2.0) / (length ** 2.0)
+        area_str = lib.clean_float(area_unit, 4)
+        area_fmt = f"{area_str} {symbol}"
+
+    return tip_("Area: {}²").format(area_fmt), None
 
 
 class MESH_OT_info_volume(Operator):
@@ -49,25 +81,9 @@ class MESH_OT_info_volume(Operator):
     def execute(self, context):
         from .. import lib
 
-        scene = context.scene
-        unit = scene.unit_settings
-        scale = 1.0 if unit.system == "NONE" else unit.scale_length
-        obj = context.active_object
-
-        bm = lib.bmesh_copy_from_object(obj, apply_modifiers=True)
-        volume = bm.calc_volume()
-        bm.free()
-
-        if unit.system == "NONE":
-            volume_fmt = lib.clean_float(volume, 8)
-        else:
-            length, symbol = _get_unit(unit.system, unit.length_unit)
-
-            volume_unit = volume * (scale ** 3.0) / (length ** 3.0)
-            volume_str = lib.clean_float(volume_unit, 4)
-            volume_fmt = f"{volume_str} {symbol}"
+        volume = lib.calc_volume(lib.mesh_tris_world(context.active_object))
 
-        report.update((tip_("Volume: {}³").format(volume_fmt), None))
+        report.update(_volume_info(volume, context.scene.unit_settings))
 
         return {"FINISHED"}
 
@@ -80,25 +96,28 @@ class MESH_OT_info_area(Operator):
     def execute(self, context):
         from .. import lib
 
-        scene = context.scene
-        unit = scene.unit_settings
-        scale = 1.0 if unit.system == "NONE" else unit.scale_length
-        obj = context.active_object
+        area = lib.calc_area(lib.mesh_tris_world(context.active_object))
 
-        bm = lib.bmesh_copy_from_object(obj, apply_modifiers=True)
-        area = lib.bmesh_calc_area(bm)
-        bm.free()
+        report.update(_area_info(area, context.scene.unit_settings))
 
-        if unit.system == "NONE":
-            area_fmt = lib.clean_float(area, 8)
-        else:
-            length, symbol = _get_unit(unit.system, unit.length_unit)
+        return {"FINISHED"}
+
+
+class MESH_OT_info_volume_area(Operator):
+    bl_idname = "mesh.print3d_info_volume_area"
+    bl_label = "Calculate Volume and Area"
+    bl_description = "Report the volume and surface area of the active mesh"
+
+    def execute(self, context):
+        from .. import lib
+
+        unit = context.scene.unit_settings
 
-            area_unit = area * (scale ** 2.0) / (length ** 2.0)
-            area_str = lib.clean_float(area_unit, 4)
-            area_fmt = f"{area_str} {symbol}"
+        tris = lib.mesh_tris_world(context.active_object)
+        volume = lib.calc_volume(tris)
+        area = lib.calc_area(tris)
 
-        report.update((tip_("Area: {}²").format(area_fmt), None))
+        report.update(_volume_info(volume, unit), _area_info(area, unit))
 
         return {"FINISHED"}
 
@@ -108,11 +127,15 @@ class MESH_OT_info_area(Operator):
 
 
 def execute_check(self, context):
+    from .. import lib
+
     obj = context.active_object
+    props = context.scene.print3d_toolbox
 
     info = []
-    self.main_check(obj, info)
+    self.main_check(obj, info, props)
     report.update(*info)
+    lib.scratch_clear()
 
     multiple_obj_warning(self, context)
 
@@ -125,27 +148,112 @@ def multiple_obj_warning(self, context) -> None:
         self.report({"WARNING"}, "Multiple selected objects. Only the active one will be evaluated")
 
 
-class MESH_OT_check_solid(Operator):
-    bl_idname = "mesh.print3d_check_solid"
-    bl_label = "Solid"
-    bl_description = "Check for geometry is solid (has valid inside/outside) and correct normals"
+def _check_solid(obj: Object, info: list, props, arrays=None) -> None:
+    from bmesh.types import BMEdge
+    from .. import lib
 
-    @staticmethod
-    def main_check(obj: Object, info: list):
-        import array
-        from .. import lib
+    # TODO bow-tie quads
+
+    if arrays is None:
+        arrays = lib.MeshArrays(obj)
+
+    edges_non_manifold, edges_non_contig = lib.mesh_check_solid(arrays)
+
+    info.append((tip_("Non-manifold Edges: {}").format(len(edges_non_manifold)), (BMEdge, edges_non_manifold)))
+    info.append((tip_("Bad Contiguous Edges: {}").format(len(edges_non_contig)), (BMEdge, edges_non_contig)))
+
+
+def _check_intersections(obj: Object, info: list, props, arrays=None) -> None:
+    from bmesh.types import BMFace
+    from .. import lib
+
+    if arrays is None:
+        arrays = lib.MeshArrays(obj)
+
+    faces_intersect = lib.mesh_check_intersect(arrays)
+    info.append((tip_("Intersect Face: {}").format(len(faces_intersect)), (BMFace, faces_intersect)))
+
+
+def _check_degenerate(obj: Object, info: list, props, arrays=None) -> None:
+    from bmesh.types import BMEdge, BMFace
+    from .. import lib
+
+    threshold = props.threshold_zero
+
+    if arrays is None:
+        arrays = lib.MeshArrays(obj)
+
+    faces_zero, edges_zero = lib.mesh_check_degenerate(arrays, threshold)
+
+    info.append((tip_("Zero Faces: {}").format(len(faces_zero)), (BMFace, faces_zero)))
+    info.append((tip_("Zero Edges: {}").format(len(edges_zero)), (BMEdge, edges_zero)))
+
+
+def _check_nonplanar(obj: Object, info: list, props, arrays=None) -> None:
+    from bmesh.types import BMFace
+    from .. import lib
+
+    angle_nonplanar = props.angle_nonplanar
+
+    if arrays is None:
+        arrays = lib.MeshArrays(obj)
+
+    faces_distort = lib.mesh_check_nonplanar(arrays, angle_nonplanar)
+
+    info.append((tip_("Non-flat Faces: {}").format(len(faces_distort)), (BMFace, faces_distort)))
+
+
+def _check_thick(obj: Object, info: list, props, arrays=None) -> None:
+    from bmesh.types import BMFace
+    from .. import lib
+
+    thickness_min = props.thickness_min
+
+    if arrays is None:
+        arrays = lib.MeshArrays(obj)
+
+    faces_error = lib.mesh_check_thick(arrays, thickness_min)
+    info.append((tip_("Thin Faces: {}").format(len(faces_error)), (BMFace, faces_error)))
+
+
+def _check_sharp(obj: Object, info: list, props, arrays=None) -> None:
+    from bmesh.types import BMEdge
+    from .. import lib
+
+    angle_sharp = props.angle_sharp
+
+    if arrays is None:
+        arrays = lib.MeshArrays(obj)
+
+    edges_sharp = lib.mesh_check_sharp(arrays, angle_sharp)
+
+    info.append((tip_("Sharp Edge: {}").format(len(edges_sharp)), (BMEdge, edges_sharp)))
+
+
+def _check_overhang(obj: Object, info: list, props, arrays=None) -> None:
+    from bmesh.types import BMFace
+    from .. import lib
+
+    angle_overhang = _HALF_PI - props.angle_overhang
 
-        # TODO bow-tie quads
+    if angle_overhang == math.pi:
+        info.append(("Skipping Overhang", ()))
+        return
 
-        bm = lib.bmesh_copy_from_object(obj, transform=False, triangulate=False)
+    if arrays is None:
+        arrays = lib.MeshArrays(obj)
 
-        edges_non_manifold = array.array("i", (i for i, ele in enumerate(bm.edges) if not ele.is_manifold))
-        edges_non_contig = array.array("i", (i for i, ele in enumerate(bm.edges) if ele.is_manifold and (not ele.is_contiguous)))
+    faces_overhang = lib.mesh_check_overhang(arrays, angle_overhang)
 
-        info.append((tip_("Non-manifold Edges: {}").format(len(edges_non_manifold)), (BMEdge, edges_non_manifold)))
-        info.append((tip_("Bad Contiguous Edges: {}").format(len(edges_non_contig)), (BMEdge, edges_non_contig)))
+    info.append((tip_("Overhang Face: {}").format(len(faces_overhang)), (BMFace, faces_overhang)))
 
-        bm.free()
+
+class MESH_OT_check_solid(Operator):
+    bl_idname = "mesh.print3d_check_solid"
+    bl_label = "Solid"
+    bl_description = "Check for geometry is solid (has valid inside/outside) and correct normals"
+
+    main_check = staticmethod(_check_solid)
 
     def execute(self, context):
         return execute_check(self, context)
@@ -156,12 +264,7 @@ class MESH_OT_check_intersections(Operator):
     bl_label = "Intersections"
     bl_description = "Check for self intersections"
 
-    @staticmethod
-    def main_check(obj: Object, info: list):
-        from .. import lib
-
-        faces_intersect = lib.bmesh_check_self_intersect_object(obj)
-        info.append((tip_("Intersect Face: {}").format(len(faces_intersect)), (BMFace, faces_intersect)))
+    main_check = staticmethod(_check_intersections)
 
     def execute(self, context):
         return execute_check(self, context)
@@ -172,22 +275,7 @@ class MESH_OT_check_degenerate(Operator):
     bl_label = "Degenerate"
     bl_description = "Check for zero area faces and zero length edges"
 
-    @staticmethod
-    def main_check(obj: Object, info: list):
-        import array
-        from .. import lib
-
-        threshold = bpy.context.scene.print3d_toolbox.threshold_zero
-
-        bm = lib.bmesh_copy_from_object(obj, transform=False, triangulate=False)
-
-        faces_zero = array.array("i", (i for i, ele in enumerate(bm.faces) if ele.calc_area() <= threshold))
-        edges_zero = array.array("i", (i for i, ele in enumerate(bm.edges) if ele.calc_length() <= threshold))
-
-        info.append((tip_("Zero Faces: {}").format(len(faces_zero)), (BMFace, faces_zero)))
-        info.append((tip_("Zero Edges: {}").format(len(edges_zero)), (BMEdge, edges_zero)))
-
-        bm.free()
+    main_check = staticmethod(_check_degenerate)
 
     def execute(self, context):
         return execute_check(self, context)
@@ -198,21 +286,7 @@ class MESH_OT_check_nonplanar(Operator):
     bl_label = "Non-Planar"
     bl_description = "Check for non-flat faces"
 
-    @staticmethod
-    def main_check(obj: Object, info: list):
-        import array
-        from .. import lib
-
-        angle_nonplanar = bpy.context.scene.print3d_toolbox.angle_nonplanar
-
-        bm = lib.bmesh_copy_from_object(obj, transform=True, triangulate=False)
-        bm.normal_update()
-
-        faces_distort = array.array("i", (i for i, ele in enumerate(bm.faces) if lib.face_is_distorted(ele, angle_nonplanar)))
-
-        info.append((tip_("Non-flat Faces: {}").format(len(faces_distort)), (BMFace, faces_distort)))
-
-        bm.free()
+    main_check = staticmethod(_check_nonplanar)
 
     def execute(self, context):
         return execute_check(self, context)
@@ -223,14 +297,7 @@ class MESH_OT_check_thick(Operator):
     bl_label = "Thickness"
     bl_description = "Check for wall thickness below specified value"
 
-    @staticmethod
-    def main_check(obj: Object, info: list):
-        from .. import lib
-
-        thickness_min = bpy.context.scene.print3d_toolbox.thickness_min
-
-        faces_error = lib.bmesh_check_thick_object(obj, thickness_min)
-        info.append((tip_("Thin Faces: {}").format(len(faces_error)), (BMFace, faces_error)))
+    main_check = staticmethod(_check_thick)
 
     def execute(self, context):
         return execute_check(self, context)
@@ -241,22 +308,7 @@ class MESH_OT_check_sharp(Operator):
     bl_label = "Sharp"
     bl_description = "Check for edges sharper than a specified angle"
 
-    @staticmethod
-    def main_check(obj: Object, info: list):
-        from .. import lib
-
-        angle_sharp = bpy.context.scene.print3d_toolbox.angle_sharp
-
-        bm = lib.bmesh_copy_from_object(obj, transform=True, triangulate=False)
-        bm.normal_update()
-
-        edges_sharp = [
-            ele.index for ele in bm.edges
-            if ele.is_manifold and ele.calc_face_angle_signed() > angle_sharp
-        ]
-
-        info.append((tip_("Sharp Edge: {}").format(len(edges_sharp)), (BMEdge, edges_sharp)))
-        bm.free()
+    main_check = staticmethod(_check_sharp)
 
     def execute(self, context):
         return execute_check(self, context)
@@ -267,31 +319,7 @@ class MESH_OT_check_overhang(Operator):
     bl_label = "Overhang"
     bl_description = "Check for faces that overhang past a specified angle"
 
-    @staticmethod
-    def main_check(obj: Object, info: list):
-        from mathutils import Vector
-        from .. import lib
-
-        angle_overhang = (math.pi / 2.0) - bpy.context.scene.print3d_toolbox.angle_overhang
-
-        if angle_overhang == math.pi:
-            info.append(("Skipping Overhang", ()))
-            return
-
-        bm = lib.bmesh_copy_from_object(obj, transform=True, triangulate=False)
-        bm.normal_update()
-
-        z_down = Vector((0, 0, -1.0))
-        z_down_angle = z_down.angle
-
-        # 4.0 ignores zero area faces
-        faces_overhang = [
-            ele.index for ele in bm.faces
-            if z_down_angle(ele.normal, 4.0) < angle_overhang
-        ]
-
-        info.append((tip_("Overhang Face: {}").format(len(faces_overhang)), (BMFace, faces_overhang)))
-        bm.free()
+    main_check = staticmethod(_check_overhang)
 
     def execute(self, context):
         return execute_check(self, context)
@@ -304,50 +332,80 @@ class OBJECT_OT_optimize_overhang(Operator):
     bl_options = {"REGISTER", "UNDO"}
 
     @staticmethod
-    def _iter_rotations(iterations: int):
+    @functools.lru_cache(maxsize=8)
+    def _rotation_angles(iterations: int):
+        """Pitch and yaw of Fibonacci lattice sample rotations."""
+        import numpy as np
+
         golden_angle = math.pi * (3.0 - math.sqrt(5.0))
+        i = np.arange(iterations, dtype=np.float64)
+
+        yaw = (i * golden_angle) % math.tau
+        pitch = np.arccos(1.0 - 2.0 * ((i + 0.5) / iterations)) - _HALF_PI
 
-        for i in range(iterations):
-            yaw = (i * golden_angle) % (math.tau)
-            pitch = math.acos(1.0 - 2.0 * ((i + 0.5) / iterations)) - (math.pi / 2.0)
-            yield Euler((pitch, 0.0, yaw)).to_quaternion()
+        return pitch, yaw
 
     @staticmethod
-    def _overhang_score(obj: Object, matrix_world: Matrix, limit_angle: float) -> tuple[int, float]:
+    def _scaled_normals(obj: Object, scale: Vector):
+        import numpy as np
         from .. import lib
 
-        bm = lib.bmesh_copy_from_object(obj, transform=False, triangulate=False)
+        sx, sy, sz = scale
+        # Cofactor of the scale matrix, same as recalculating normals from scaled geometry
+        normals = lib.MeshArrays(obj).poly_normals * np.array((sy * sz, sx * sz, sx * sy), dtype=np.float32)
+        lengths = np.sqrt(np.einsum("ij,ij->i", normals, normals))
 
-        mat = matrix_world.copy()
-        mat.translation.zero()
-        if not mat.is_identity:
-            bm.transform(mat)
-            bm.normal_update()
+        # Zero length normals are ignored
+        is_valid = lengths > 0.0
+        return normals[is_valid] / lengths[is_valid, None]
 
-        z_down = Vector((0.0, 0.0, -1.0))
-        z_down_angle = z_down.angle
-        angle_overhang = (math.pi / 2.0) - limit_angle
+    @staticmethod
+    def _overhang_scores(normals, z_rows, limit_angle: float) -> list[tuple[int, float]]:
+        """Scores of rotations given by their Z rows, first rotation is the current one.
+
+        Rotations with more overhang faces than the first one stop being scored,
+        their counts are partial but still rank below it.
+        """
+        import numpy as np
+
+        if not len(normals):
+            return [(0, -1.0)] * len(z_rows)
+
+        # Rotation keeps normals unit length, only Z row is needed for the down axis dot product
+        axes = -np.asarray(z_rows, dtype=np.float32)
+        cos_limit = math.cos(_HALF_PI - limit_angle)
 
-        overhang_count = 0
-        min_angle = math.pi
+        cos_down = normals @ axes[0]
+        counts = np.zeros(len(axes), dtype=np.int64)
+        counts[0] = np.count_nonzero(cos_down > cos_limit)
+        # Largest cosine is the smallest angle to the down axis, compared without acos
+        cos_max = np.full(len(axes), -1.0, dtype=np.float32)
+        cos_max[0] = cos_down.max()
 
-        for face in bm.faces:
-            angle = z_down_angle(face.normal, 4.0)
-            min_angle = min(min_angle, angle)
-            if angle < angle_overhang:
-                overhang_count += 1
+        # Score in face tiles with one matrix product each, bounded to ~16 MB of dot products
+        active = np.arange(1, len(axes))
+        step = max(1, (1 << 22) // max(1, len(active)))
 
-        bm.free()
+        for i in range(0, len(normals), step):
+            if not len(active):
+                break
 
-        return overhang_count, min_angle
+            cos_down = normals[i:i + step] @ axes[active].T
+            counts[active] += np.count_nonzero(cos_down > cos_limit, axis=0)
+            cos_max[active] = np.maximum(cos_max[active], cos_down.max(axis=0))
+
+            active = active[counts[active] <= counts[0]]
+
+        return list(zip(counts.tolist(), cos_max.tolist()))
 
     @staticmethod
     def _is_better(score: tuple[int, float], current: tuple[int, float]) -> bool:
-        count, angle = score
-        best_count, best_angle = current
-        return count < best_count or (count == best_count and angle > best_angle)
+        # Fewer overhang faces first, then smaller cosine (larger angle) to the down axis
+        return score < current
 
     def execute(self, context):
+        import numpy as np
+
         if context.mode not in {"OBJECT", "EDIT_MESH"}:
             return {"CANCELLED"}
 
@@ -362,23 +420,31 @@ class OBJECT_OT_optimize_overhang(Operator):
         limit_angle = props.overhang_optimize_angle
 
         loc, rot, scale = obj.matrix_world.decompose()
-        base_matrix = Matrix.LocRotScale(loc, rot, scale)
-        best_matrix = base_matrix
-        best_score = self._overhang_score(obj, base_matrix, limit_angle)
+        normals = self._scaled_normals(obj, scale)
+
+        # Z row of Euler((pitch, 0, yaw)) @ rot, yaw is applied last and does not change it
+        pitch, yaw = self._rotation_angles(iterations)
+        rot_mat = np.array(rot.to_matrix())
+        z_rows = np.column_stack((np.zeros_like(pitch), np.sin(pitch), np.cos(pitch))) @ rot_mat
 
-        for quat in self._iter_rotations(iterations):
-            candidate_rot = quat @ rot
-            candidate_matrix = Matrix.LocRotScale(loc, candidate_rot, scale)
-            score = self._overhang_score(obj, candidate_matrix, limit_angle)
+        scores = self._overhang_scores(normals, np.vstack((rot_mat[2], z_rows)), limit_angle)
+        best_index = 0
+        best_score = scores[0]
 
+        for i, score in enumerate(scores):
             if self._is_better(score, best_score):
                 best_score = score
-                best_matrix = candidate_matrix
+                best_index = i
 
-        obj.matrix_world = best_matrix
+        if best_index:
+            best_rot = Euler((pitch[best_index - 1], 0.0, yaw[best_index - 1])).to_quaternion() @ rot
+        else:
+            best_rot = rot
+
+        obj.matrix_world = Matrix.LocRotScale(loc, best_rot, scale)
 
-        overhang_faces, min_angle = best_score
-        angle_deg = math.degrees(min_angle)
+        overhang_faces, cos_max = best_score
+        angle_deg = math.degrees(math.acos(max(-1.0, min(cos_max, 1.0))))
         self.report(
             {"INFO"},
             tip_("Overhang optimized: {} overhang faces, smallest angle {:.1f}°").format(
@@ -397,22 +463,24 @@ class MESH_OT_check_all(Operator):
     bl_description = "Run all checks"
     bl_options = {"INTERNAL"}
 
-    check_cls = (
-        MESH_OT_check_solid,
-        MESH_OT_check_intersections,
-        MESH_OT_check_degenerate,
-        MESH_OT_check_nonplanar,
-        MESH_OT_check_thick,
-        MESH_OT_check_sharp,
-        MESH_OT_check_overhang,
+    prefetch_batch = 4
+
+    check_fns = (
+        _check_solid,
+        _check_intersections,
+        _check_degenerate,
+        _check_nonplanar,
+        _check_thick,
+        _check_sharp,
+        _check_overhang,
     )
 
     @staticmethod
-    def _check_object(obj: Object, include_data: bool) -> list[tuple[str, tuple | None]]:
+    def _check_object(obj: Object, props, arrays, include_data: bool) -> list[tuple[str, tuple | None]]:
         info_obj: list[tuple[str, tuple | None]] = []
 
-        for cls in MESH_OT_check_all.check_cls:
-            cls.main_check(obj, info_obj)
+        for check in MESH_OT_check_all.check_fns:
+            check(obj, info_obj, props, arrays)
 
         if include_data:
             return [(f"{obj.name}: {text}", data) for text, data in info_obj]
@@ -423,41 +491,29 @@ class MESH_OT_check_all(Operator):
         if len(objects) < 2 or tolerance <= 0.0:
             return []
 
-        from mathutils import Vector
+        import numpy as np
 
-        def _bbox_world(ob: Object) -> tuple[Vector, Vector]:
-            coords = [ob.matrix_world @ Vector(corner) for corner in ob.bound_box]
-            mins = Vector((min(c[i] for c in coords) for i in range(3)))
-            maxs = Vector((max(c[i] for c in coords) for i in range(3)))
-            return mins, maxs
+        # World space bounding boxes of all objects at once
+        corners = np.array([ob.bound_box for ob in objects], dtype=np.float64)
+        matrices = np.array([ob.matrix_world for ob in objects], dtype=np.float64)
+        coords = np.einsum("nij,nkj->nki", matrices[:, :3, :3], corners) + matrices[:, None, :3, 3]
+        mins = coords.min(axis=1)
+        maxs = coords.max(axis=1)
 
-        def _axis_gap(min_a: float, max_a: float, min_b: float, max_b: float) -> float:
-            if max_a < min_b:
-                return min_b - max_a
-            if max_b < min_a:
-                return min_a - max_b
-            return 0.0
+        # Pairwise per-axis gaps, zero when intervals overlap
+        gaps = np.maximum(mins[:, None] - maxs[None, :], mins[None, :] - maxs[:, None]).clip(min=0.0)
+        clearance = gaps.max(axis=2)
 
         info = []
         tol_text = f"{tolerance:.4f}m"
 
-        for i, obj_a in enumerate(objects):
-            min_a, max_a = _bbox_world(obj_a)
-            for obj_b in objects[i + 1:]:
-                min_b, max_b = _bbox_world(obj_b)
-                gaps = (
-                    _axis_gap(min_a.x, max_a.x, min_b.x, max_b.x),
-                    _axis_gap(min_a.y, max_a.y, min_b.y, max_b.y),
-                    _axis_gap(min_a.z, max_a.z, min_b.z, max_b.z),
-                )
-                clearance = max(gaps)
-                if clearance < tolerance:
-                    info.append((
-                        tip_("Assembly clearance {} vs {}: {:.4f}m is below tolerance {}".format(
-                            obj_a.name, obj_b.name, clearance, tol_text,
-                        )),
-                        None,
-                    ))
+        for i, j in zip(*np.nonzero(np.triu(clearance < tolerance, k=1))):
+            info.append((
+                tip_("Assembly clearance {} vs {}: {:.4f}m is below tolerance {}".format(
+                    objects[i].name, objects[j].name, clearance[i, j], tol_text,
+                )),
+                None,
+            ))
 
         return info
 
@@ -465,6 +521,8 @@ class MESH_OT_check_all(Operator):
         obj = context.active_object
         props = context.scene.print3d_toolbox
 
+        from .. import lib
+
         if props.analyze_selected_objects:
             selected = [ob for ob in context.selected_objects if ob.type == "MESH"]
             if not selected:
@@ -472,9 +530,18 @@ class MESH_OT_check_all(Operator):
                 return {"CANCELLED"}
 
             info_batch: list[tuple[str, tuple | None]] = []
-            for ob in selected:
-                include_data = ob == obj
-                info_batch.extend(self._check_object(ob, include_data))
+
+            # Objects of a batch share one worker pool, each object's arrays
+            # are dropped once checked so peak memory stays near one batch
+            for i in range(0, len(selected), self.prefetch_batch):
+                batch = selected[i:i + self.prefetch_batch]
+                arrays_seq = [lib.MeshArrays(ob) for ob in batch]
+                lib.prefetch_mesh_arrays(arrays_seq)
+
+                for j, ob in enumerate(batch):
+                    include_data = ob == obj
+                    info_batch.extend(self._check_object(ob, props, arrays_seq[j], include_data))
+                    arrays_seq[j] = None
 
             if props.use_assembly_tolerance:
                 info_batch.extend(self._assembly_clearance_info(selected, props.assembly_tolerance))
@@ -482,13 +549,18 @@ class MESH_OT_check_all(Operator):
             report.update(*info_batch)
         else:
             info = []
-            for cls in self.check_cls:
-                cls.main_check(obj, info)
+            arrays = lib.MeshArrays(obj)
+            lib.prefetch_mesh_arrays((arrays,))
+
+            for check in self.check_fns:
+                check(obj, info, props, arrays)
 
             report.update(*info)
 
             multiple_obj_warning(self, context)
 
+        lib.scratch_clear()
+
         return {"FINISHED"}
 
 
@@ -501,18 +573,20 @@ class MESH_OT_report_select(Operator):
     index: IntProperty()
 
     _type_to_mode = {
-        BMVert: "VERT",
-        BMEdge: "EDGE",
-        BMFace: "FACE",
+        "BMVert": "VERT",
+        "BMEdge": "EDGE",
+        "BMFace": "FACE",
     }
 
     _type_to_attr = {
-        BMVert: "verts",
-        BMEdge: "edges",
-        BMFace: "faces",
+        "BMVert": "verts",
+        "BMEdge": "edges",
+        "BMFace": "faces",
     }
 
     def execute(self, context):
+        import bmesh
+
         obj = context.edit_object
         info = report.info()
 
@@ -527,20 +601,25 @@ class MESH_OT_report_select(Operator):
             return {"CANCELLED"}
 
         bm_type, bm_array = data
+        type_name = bm_type.__name__
 
         bpy.ops.mesh.reveal()
         bpy.ops.mesh.select_all(action="DESELECT")
-        bpy.ops.mesh.select_mode(type=self._type_to_mode[bm_type])
+        bpy.ops.mesh.select_mode(type=self._type_to_mode[type_name])
 
         bm = bmesh.from_edit_mesh(obj.data)
-        elems = getattr(bm, MESH_OT_report_select._type_to_attr[bm_type])[:]
+        elems = getattr(bm, MESH_OT_report_select._type_to_attr[type_name])
 
-        for i in bm_array:
-            try:
-                elems[i].select_set(True)
-            except IndexError:
-                self.report({"ERROR"}, "Report is out of date, re-run check")
-                return {"CANCELLED"}
+        if len(bm_array) and bm_array.max() >= len(elems):
+            self.report({"ERROR"}, "Report is out of date, re-run check")
+            return {"CANCELLED"}
+
+        elems.ensure_lookup_table()
+
+        for i in bm_array.tolist():
+            elems[i].select_set(True)
+
+        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
 
         return {"FINISHED"}
 
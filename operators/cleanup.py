@@ -141,8 +141,8 @@ class MESH_OT_clean_non_manifold(Operator):
         """return a set of coordinates of non-manifold vertices"""
         cls.select_non_manifold_verts(use_wire=True, use_boundary=True, use_verts=True)
 
-        bm = bmesh.from_edit_mesh(context.edit_object.data)
-        return sum((1 for v in bm.verts if v.select))
+        # Selection total is kept by the edit-mesh, no need to iterate vertices
+        return context.edit_object.data.total_vert_sel
 
     @classmethod
     def fill_non_manifold(cls, sides: int):
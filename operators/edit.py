@@ -9,13 +9,26 @@ import math
 import importlib
 import importlib.util
 
-import bmesh
 import bpy
 from bpy.app.translations import pgettext_tip as tip_
 from bpy.props import BoolProperty, EnumProperty, FloatProperty, IntProperty
 from bpy.types import Operator
 
 
+_modules = {}
+_VDB_MODULE = "openvdb" if bpy.app.version >= (4, 4, 0) else "pyopenvdb"
+
+
+def _import_optional(name: str):
+    """Import optional dependency once, returns None if it is not installed."""
+    if name not in _modules:
+        if importlib.util.find_spec(name) is None:
+            return None
+        _modules[name] = importlib.import_module(name)
+
+    return _modules[name]
+
+
 class MESH_OT_hollow(Operator):
     bl_idname = "mesh.print3d_hollow"
     bl_label = "Hollow"
@@ -65,21 +78,16 @@ class MESH_OT_hollow(Operator):
         layout.prop(self, "make_hollow_duplicate")
 
     def execute(self, context):
-        numpy_spec = importlib.util.find_spec("numpy")
-        if numpy_spec is None:
+        np = _import_optional("numpy")
+        if np is None:
             self.report({"ERROR"}, "NumPy is required for hollowing. Install numpy and try again")
             return {"CANCELLED"}
 
-        np = importlib.import_module("numpy")
-
-        vdb_module = "openvdb" if bpy.app.version >= (4, 4, 0) else "pyopenvdb"
-        vdb_spec = importlib.util.find_spec(vdb_module)
-        if vdb_spec is None:
-            self.report({"ERROR"}, f"{vdb_module} is required for hollowing. Install the dependency and try again")
+        vdb = _import_optional(_VDB_MODULE)
+        if vdb is None:
+            self.report({"ERROR"}, f"{_VDB_MODULE} is required for hollowing. Install the dependency and try again")
             return {"CANCELLED"}
 
-        vdb = importlib.import_module(vdb_module)
-
         if not self.offset:
             return {"FINISHED"}
 
@@ -95,12 +103,10 @@ class MESH_OT_hollow(Operator):
         # Read mesh to numpy arrays
         nverts = len(mesh_target.vertices)
         ntris = len(mesh_target.loop_triangles)
-        verts = np.zeros(3 * nverts, dtype=np.float32)
-        tris = np.zeros(3 * ntris, dtype=np.int32)
-        mesh_target.vertices.foreach_get("co", verts)
-        verts.shape = (-1, 3)
-        mesh_target.loop_triangles.foreach_get("vertices", tris)
-        tris.shape = (-1, 3)
+        verts = np.empty((nverts, 3), dtype=np.float32)
+        tris = np.empty((ntris, 3), dtype=np.int32)
+        mesh_target.vertices.foreach_get("co", verts.ravel())
+        mesh_target.loop_triangles.foreach_get("vertices", tris.ravel())
 
         # Generate VDB levelset
         half_width = max(3.0, math.ceil(abs(self.offset) / self.voxel_size) + 2.0) # half_width has to envelop offset
@@ -111,17 +117,35 @@ class MESH_OT_hollow(Operator):
         if self.offset_direction == "INSIDE":
             newverts, newquads = levelset.convertToQuads(-self.offset)
             if newquads.size == 0:
+                bpy.data.meshes.remove(mesh_target)
                 self.report({"ERROR"}, "Make sure target mesh has closed surface and offset value is less than half of target thickness")
-                return {"FINISHED"}
+                return {"CANCELLED"}
         else:
             newverts, newquads = levelset.convertToQuads(self.offset)
 
         bpy.ops.object.select_all(action="DESELECT")
         mesh_offset = bpy.data.meshes.new(mesh_target.name + " offset")
-        mesh_offset.from_pydata(newverts, [], list(newquads))
 
-        # For some reason OpenVDB has inverted normals
-        mesh_offset.flip_normals()
+        # Write mesh from numpy arrays, OpenVDB returns unsigned indices,
+        # reinterpret them in place instead of converting
+        if newquads.dtype == np.uint32:
+            newquads = newquads.view(np.int32)
+
+        nquads = len(newquads)
+        mesh_offset.vertices.add(len(newverts))
+        mesh_offset.vertices.foreach_set("co", np.ascontiguousarray(newverts, dtype=np.float32).ravel())
+        mesh_offset.loops.add(4 * nquads)
+        mesh_offset.loops.foreach_set("vertex_index", np.ascontiguousarray(newquads, dtype=np.int32).ravel())
+        mesh_offset.polygons.add(nquads)
+        mesh_offset.polygons.foreach_set("loop_start", np.arange(0, 4 * nquads, 4, dtype=np.int32))
+        mesh_offset.update(calc_edges=True)
+        mesh_offset.shade_flat()  # Same as from_pydata() default
+
+        # For some reason OpenVDB has inverted normals,
+        # inner wall of hollow duplicate needs them inverted anyway
+        if not (self.make_hollow_duplicate and self.offset_direction == "INSIDE"):
+            mesh_offset.flip_normals()
+
         obj_offset = bpy.data.objects.new(obj.name + " offset", mesh_offset)
         obj_offset.matrix_world.translation = obj.matrix_world.translation
         bpy.context.collection.objects.link(obj_offset)
@@ -133,9 +157,7 @@ class MESH_OT_hollow(Operator):
             bpy.context.collection.objects.link(obj_hollow)
             obj_hollow.matrix_world.translation = obj.matrix_world.translation
             obj_hollow.select_set(True)
-            if self.offset_direction == "INSIDE":
-                mesh_offset.flip_normals()
-            else:
+            if self.offset_direction == "OUTSIDE":
                 mesh_target.flip_normals()
             context.view_layer.objects.active = obj_hollow
             bpy.ops.object.join()
@@ -171,10 +193,11 @@ class OBJECT_OT_align_xy(Operator):
         # FIXME: Undo is inconsistent.
         # FIXME: Would be nicer if rotate could pick some object-local axis.
 
+        import numpy as np
         from mathutils import Vector
+        from .. import lib
 
         self.context = context
-        mode_orig = context.mode
         skip_invalid = []
 
         for obj in context.selected_objects:
@@ -182,28 +205,19 @@ class OBJECT_OT_align_xy(Operator):
             orig_scale = obj.scale.copy()
 
             # When in edit mode, do as the edit mode does.
-            if mode_orig == "EDIT_MESH":
-                bm = bmesh.from_edit_mesh(obj.data)
-                faces = [f for f in bm.faces if f.select]
-            else:
-                faces = [p for p in obj.data.polygons if p.select]
+            arrays = lib.MeshArrays(obj)
+            is_selected = np.empty(len(arrays.me.polygons), dtype=bool)
+            arrays.me.polygons.foreach_get("select", is_selected)
 
-            if not faces:
+            if not is_selected.any():
                 skip_invalid.append(obj.name)
                 continue
 
             # Rotate object so average normal of selected faces points down.
-            normal = Vector((0.0, 0.0, 0.0))
+            weights = is_selected.astype(np.float32)
             if self.use_face_area:
-                for face in faces:
-                    if mode_orig == "EDIT_MESH":
-                        normal += (face.normal * face.calc_area())
-                    else:
-                        normal += (face.normal * face.area)
-            else:
-                for face in faces:
-                    normal += face.normal
-            normal = normal.normalized()
+                weights *= arrays.poly_areas
+            normal = Vector(weights @ arrays.poly_normals).normalized()
             normal.rotate(obj.matrix_world)  # local -> world.
             offset = normal.rotation_difference(Vector((0.0, 0.0, -1.0)))
             offset = offset.to_matrix().to_4x4()
@@ -227,11 +241,19 @@ class OBJECT_OT_align_xy(Operator):
 
 
 def _bounds_lengths(obj, depsgraph):
-    from mathutils import Vector
+    import numpy as np
 
     obj_eval = obj.evaluated_get(depsgraph)
-    coords = [Vector(v) @ obj_eval.matrix_world for v in obj_eval.bound_box]
-    return tuple(max(c[i] for c in coords) - min(c[i] for c in coords) for i in range(3))
+    corners = np.array(obj_eval.bound_box, dtype=np.float64)
+    mat = np.array(obj_eval.matrix_world.to_3x3(), dtype=np.float64)
+    # Translation does not affect extents
+    return tuple(np.ptp(corners @ mat.T, axis=0).tolist())
+
+
+def _bed_overflow(length: float, limit: float) -> float:
+    # Ignore rounding noise, a length scaled to exactly fit the limit must not overflow
+    overflow = length - limit
+    return overflow if overflow > limit * 1e-6 else 0.0
 
 
 class OBJECT_OT_check_bed_fit(Operator):
@@ -274,10 +296,7 @@ class OBJECT_OT_check_bed_fit(Operator):
         depsgraph = context.evaluated_depsgraph_get()
         lengths = _bounds_lengths(obj, depsgraph)
 
-        overflows = []
-        for i, axis in enumerate("XYZ"):
-            if lengths[i] > bed_dims[i]:
-                overflows.append((i, axis))
+        overflows = [axis for i, axis in enumerate("XYZ") if _bed_overflow(lengths[i], bed_dims[i])]
 
         lines = [tip_("Build volume"), tip_("X/Y/Z: {} / {} / {}").format(*[lib.clean_float(v, 4) for v in bed_dims])]
         flags = [False, False, False]
@@ -291,23 +310,25 @@ class OBJECT_OT_check_bed_fit(Operator):
             scale = min(valid_lengths)
             _scale(scale, report=self.report, report_suffix=tip_(", Fit to build volume"))
 
-            lengths = _bounds_lengths(obj, depsgraph)
-            overflows.clear()
-            for i, axis in enumerate("XYZ"):
-                if lengths[i] > bed_dims[i]:
-                    overflows.append((i, axis))
+            # Only a whole scaled object keeps its proportions,
+            # edit-mode scales selected vertices and unselected objects are left as is
+            if context.mode == "OBJECT" and obj in context.selected_editable_objects:
+                lengths = tuple(length * scale for length in lengths)
+            else:
+                lengths = _bounds_lengths(obj, context.evaluated_depsgraph_get())
+            overflows = [axis for i, axis in enumerate("XYZ") if _bed_overflow(lengths[i], bed_dims[i])]
 
             lines.append(tip_("Auto scale applied: {}x").format(lib.clean_float(scale, 4)))
 
         if not overflows:
             lines.append(tip_("Fits within build volume"))
         else:
-            lines.append(tip_("Does not fit: exceeds {} axis").format(", ".join(axis for _, axis in overflows)))
+            lines.append(tip_("Does not fit: exceeds {} axis").format(", ".join(overflows)))
 
         for i, axis in enumerate("XYZ"):
             limit = bed_dims[i]
             length = lengths[i]
-            overflow = max(length - limit, 0.0)
+            overflow = _bed_overflow(length, limit)
             label = tip_("{0}: {1} / {2}").format(axis, lib.clean_float(length, 4), lib.clean_float(limit, 4))
             if overflow > 0.0:
                 label += tip_(" (+{})").format(lib.clean_float(overflow, 4))
@@ -323,11 +344,70 @@ class OBJECT_OT_check_bed_fit(Operator):
         return {"FINISHED"}
 
 
+def _scale_edit_mesh(context, scale: float) -> None:
+    import bmesh
+    from mathutils import Matrix, Vector
+
+    # Scale selected vertices of all edit-meshes around their shared median point
+    bms = []
+    pivot = Vector()
+    count = 0
+
+    for obj in context.objects_in_mode_unique_data:
+        bm = bmesh.from_edit_mesh(obj.data)
+        verts = [v for v in bm.verts if v.select]
+        if not verts:
+            continue
+
+        center = sum((v.co for v in verts), Vector()) / len(verts)
+        pivot += (obj.matrix_world @ center) * len(verts)
+        count += len(verts)
+        bms.append((obj, bm, verts))
+
+    if not count:
+        return
+
+    pivot /= count
+
+    for obj, bm, verts in bms:
+        pivot_local = obj.matrix_world.inverted_safe() @ pivot
+        bmesh.ops.scale(bm, vec=(scale,) * 3, space=Matrix.Translation(-pivot_local), verts=verts)
+        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
+
+
+def _scale_objects(context, scale: float) -> None:
+    from mathutils import Matrix, Vector
+
+    # Children follow their selected parents, same as the transform operator
+    selected = set(context.selected_editable_objects)
+    objects = []
+    for obj in selected:
+        parent = obj.parent
+        while parent is not None and parent not in selected:
+            parent = parent.parent
+        if parent is None:
+            objects.append(obj)
+
+    if not objects:
+        return
+
+    pivot = sum((obj.matrix_world.translation for obj in objects), Vector()) / len(objects)
+    mat = Matrix.Translation(pivot) @ Matrix.Scale(scale, 4) @ Matrix.Translation(-pivot)
+
+    for obj in objects:
+        obj.matrix_world = mat @ obj.matrix_world
+
+
 def _scale(scale: float, report=None, report_suffix="") -> None:
     from .. import lib
 
     if scale != 1.0:
-        bpy.ops.transform.resize(value=(scale,) * 3)
+        context = bpy.context
+        if context.mode == "EDIT_MESH":
+            _scale_edit_mesh(context, scale)
+        else:
+            _scale_objects(context, scale)
+        context.view_layer.update()
 
     if report is not None:
         scale_fmt = lib.clean_float(scale, 6)
@@ -352,10 +432,11 @@ class MESH_OT_scale_to_volume(Operator):
     )
 
     def execute(self, context):
-        from .. import lib
-        scale = math.pow(self.volume, 1 / 3) / math.pow(self.volume_init, 1 / 3)
-        scale_fmt = lib.clean_float(scale, 6)
-        self.report({"INFO"}, tip_("Scaled by {}").format(scale_fmt))
+        if self.volume_init == 0.0:
+            self.report({"WARNING"}, "Object has zero volume")
+            return {"CANCELLED"}
+
+        scale = (self.volume / self.volume_init) ** (1.0 / 3.0)
         _scale(scale, self.report)
         return {"FINISHED"}
 
@@ -364,10 +445,7 @@ class MESH_OT_scale_to_volume(Operator):
         def calc_volume(obj):
             from .. import lib
 
-            bm = lib.bmesh_copy_from_object(obj, apply_modifiers=True)
-            volume = bm.calc_volume(signed=True)
-            bm.free()
-            return volume
+            return lib.calc_volume(lib.mesh_tris_world(obj), signed=True)
 
         if not context.selectable_objects:
             self.report({"ERROR"}, "At least one mesh object must be selected")
@@ -415,27 +493,25 @@ class MESH_OT_scale_to_bounds(Operator):
         return {"FINISHED"}
 
     def invoke(self, context, event):
-        from mathutils import Vector
+        import numpy as np
 
-        def calc_length(vecs):
-            return max(((max(v[i] for v in vecs) - min(v[i] for v in vecs)), i) for i in range(3))
+        if context.mode == "EDIT_MESH":
+            objects = [context.edit_object]
+        else:
+            objects = [obj for obj in context.selected_editable_objects if obj.type == "MESH"]
 
-        if not context.selectable_objects:
+        if not objects:
             self.report({"ERROR"}, "At least one mesh object must be selected")
             return {"CANCELLED"}
 
-        if context.mode == "EDIT_MESH":
-            length, axis = calc_length(
-                [Vector(v) @ obj.matrix_world for obj in [context.edit_object] for v in obj.bound_box]
-            )
-        else:
-            length, axis = calc_length(
-                [
-                    Vector(v) @ obj.matrix_world for obj in context.selected_editable_objects
-                    if obj.type == "MESH"
-                    for v in obj.bound_box
-                ]
-            )
+        corners = []
+        for obj in objects:
+            mat = np.array(obj.matrix_world, dtype=np.float64)
+            corners.append(np.array(obj.bound_box, dtype=np.float64) @ mat[:3, :3].T + mat[:3, 3])
+
+        extents = np.ptp(np.vstack(corners), axis=0)
+        axis = int(extents.argmax())
+        length = float(extents[axis])
 
         if length == 0.0:
             self.report({"WARNING"}, "Object has zero bounds")
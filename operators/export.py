@@ -4,6 +4,10 @@
 
 # Export wrappers and integration with external tools.
 
+import re
+import shutil
+from pathlib import Path
+
 import bpy
 from bpy.app.translations import pgettext_data as data_
 from bpy.app.translations import pgettext_tip as tip_
@@ -11,6 +15,9 @@ from bpy.props import StringProperty
 from bpy.types import Image, Material, Object, Operator
 
 
+_UNSAFE_FILENAME_CHARS = re.compile(r'[\\/:*?"<>|]')
+
+
 class EXPORT_SCENE_OT_export(Operator):
     bl_idname = "export_scene.print3d_export"
     bl_label = "Export"
@@ -108,9 +115,6 @@ class EXPORT_SCENE_OT_export(Operator):
         return {"CANCELLED"}
 
     def invoke(self, context, event):
-        import re
-        from pathlib import Path
-
         if not context.selected_objects:
             return {"CANCELLED"}
 
@@ -121,7 +125,7 @@ class EXPORT_SCENE_OT_export(Operator):
         else:
             ob = context.selected_objects[0]
 
-        ob_name = re.sub(r'[\\/:*?"<>|]', "", ob.name)
+        ob_name = _UNSAFE_FILENAME_CHARS.sub("", ob.name)
 
         if bpy.data.is_saved:
             blend_name = Path(bpy.data.filepath).stem
@@ -156,21 +160,24 @@ def _image_get(mat: Material) -> Image | None:
 def _image_copy_guess(filepath: str, objects: list[Object]) -> None:
     # 'filepath' is the path we are writing to.
     image = None
-    mats = set()
+    seen = set()
 
     for obj in objects:
         for slot in obj.material_slots:
-            if slot.material:
-                mats.add(slot.material)
+            mat = slot.material
+            if mat is None or mat in seen:
+                continue
+
+            seen.add(mat)
+            image = _image_get(mat)
+            if image is not None:
+                break
 
-    for mat in mats:
-        image = _image_get(mat)
         if image is not None:
             break
 
     if image is not None:
         import os
-        import shutil
 
         imagepath = bpy.path.abspath(image.filepath, library=image.library)
         if os.path.exists(imagepath):
@@ -181,15 +188,13 @@ def _image_copy_guess(filepath: str, objects: list[Object]) -> None:
             print(f"copying texture: {imagepath!r} -> {imagepath_dst!r}")
 
             try:
-                shutil.copy(imagepath, imagepath_dst)
+                shutil.copyfile(imagepath, imagepath_dst)
             except:
                 import traceback
                 traceback.print_exc()
 
 
 def _ensure_export_dir(filepath: str, report) -> bool:
-    from pathlib import Path
-
     try:
         Path(filepath).parent.mkdir(parents=True, exist_ok=True)
     except OSError as exc:
@@ -18,6 +18,13 @@ from . import __package__ as base_package
 from . import report
 
 
+_RAD_5 = math.radians(5.0)
+_RAD_45 = math.radians(45.0)
+_RAD_90 = math.radians(90.0)
+_RAD_160 = math.radians(160.0)
+_RAD_180 = math.radians(180.0)
+
+
 BED_PROFILES = {
     "ENDER3": (220.0, 220.0, 250.0, "Ender 3 (220x220x250mm)"),
     "PRUSA_MK4": (250.0, 210.0, 220.0, "Prusa MK4 (250x210x220mm)"),
@@ -26,16 +33,56 @@ BED_PROFILES = {
 }
 
 
-def bed_profile_items(self, _context):
-    return [(key, name, "") for key, (_x, _y, _z, name) in BED_PROFILES.items()]
+_BED_PROFILE_ITEMS = tuple((key, name, "") for key, (_x, _y, _z, name) in BED_PROFILES.items())
+_BED_DIMS = {key: (x, y, z) for key, (x, y, z, _name) in BED_PROFILES.items()}
+_CUSTOM_X, _CUSTOM_Y, _CUSTOM_Z = _BED_DIMS["CUSTOM"]
+
+_PRESET_FIELDS = (
+    "export_format",
+    "use_ascii_format",
+    "use_scene_scale",
+    "use_copy_textures",
+    "use_uv",
+    "use_normals",
+    "use_colors",
+    "use_3mf_materials",
+    "use_3mf_units",
+)
+
+
+def _get_prefs(context):
+    addon = context.preferences.addons.get(base_package)
+    if addon is not None:
+        return addon.preferences
+
+
+# Strong reference to the last preset items, Blender does not keep
+# strings returned from dynamic enum callbacks alive
+_preset_items_cache = ((), ())
+
+
+def _preset_items(self, context):
+    global _preset_items_cache
+
+    if context is None:
+        return _preset_items_cache[1]
+
+    presets = getattr(_get_prefs(context), "export_presets", ())
+    names = tuple(preset.name for preset in presets)
+
+    if names != _preset_items_cache[0]:
+        items = tuple((str(i), name, "") for i, name in enumerate(names))
+        _preset_items_cache = (names, items)
+
+    return _preset_items_cache[1]
 
 
 def bed_profile_dimensions(props) -> tuple[float, float, float]:
-    if props.bed_profile == "CUSTOM":
+    profile = props.bed_profile
+    if profile == "CUSTOM":
         return props.bed_size_x, props.bed_size_y, props.bed_size_z
 
-    x, y, z, _label = BED_PROFILES[props.bed_profile]
-    return x, y, z
+    return _BED_DIMS[profile]
 
 
 class SceneProperties(PropertyGroup):
@@ -55,9 +102,9 @@ class SceneProperties(PropertyGroup):
     angle_nonplanar: FloatProperty(
         name="Limit",
         subtype="ANGLE",
-        default=math.radians(5.0),
+        default=_RAD_5,
         min=0.0,
-        max=math.radians(180.0),
+        max=_RAD_180,
         step=100,
     )
     thickness_min: FloatProperty(
@@ -72,25 +119,25 @@ class SceneProperties(PropertyGroup):
     angle_sharp: FloatProperty(
         name="Angle",
         subtype="ANGLE",
-        default=math.radians(160.0),
+        default=_RAD_160,
         min=0.0,
-        max=math.radians(180.0),
+        max=_RAD_180,
         step=100,
     )
     angle_overhang: FloatProperty(
         name="Angle",
         subtype="ANGLE",
-        default=math.radians(45.0),
+        default=_RAD_45,
         min=0.0,
-        max=math.radians(90.0),
+        max=_RAD_90,
         step=100,
     )
     overhang_optimize_angle: FloatProperty(
         name="Target Angle",
         subtype="ANGLE",
-        default=math.radians(45.0),
+        default=_RAD_45,
         min=0.0,
-        max=math.radians(90.0),
+        max=_RAD_90,
         step=100,
     )
     overhang_optimize_iterations: IntProperty(
@@ -162,25 +209,17 @@ class SceneProperties(PropertyGroup):
         if not self.export_preset or context is None:
             return
 
-        addon = context.preferences.addons.get(base_package)
-        if addon is None:
+        prefs = _get_prefs(context)
+        if prefs is None:
             return
 
-        prefs = addon.preferences
         index = int(self.export_preset)
         if index >= len(prefs.export_presets):
             return
 
         preset = prefs.export_presets[index]
-        self.export_format = preset.export_format
-        self.use_ascii_format = preset.use_ascii_format
-        self.use_scene_scale = preset.use_scene_scale
-        self.use_copy_textures = preset.use_copy_textures
-        self.use_uv = preset.use_uv
-        self.use_normals = preset.use_normals
-        self.use_colors = preset.use_colors
-        self.use_3mf_materials = preset.use_3mf_materials
-        self.use_3mf_units = preset.use_3mf_units
+        for field in _PRESET_FIELDS:
+            setattr(self, field, getattr(preset, field))
 
     # Build Volume
     # -------------------------------------
@@ -188,25 +227,25 @@ class SceneProperties(PropertyGroup):
     bed_profile: EnumProperty(
         name="Profile",
         description="Select a preset build volume or use a custom size",
-        items=bed_profile_items,
+        items=_BED_PROFILE_ITEMS,
         default="ENDER3",
     )
     bed_size_x: FloatProperty(
         name="Width",
         subtype="DISTANCE",
-        default=BED_PROFILES["CUSTOM"][0],
+        default=_CUSTOM_X,
         min=0.0,
     )
     bed_size_y: FloatProperty(
         name="Depth",
         subtype="DISTANCE",
-        default=BED_PROFILES["CUSTOM"][1],
+        default=_CUSTOM_Y,
         min=0.0,
     )
     bed_size_z: FloatProperty(
         name="Height",
         subtype="DISTANCE",
-        default=BED_PROFILES["CUSTOM"][2],
+        default=_CUSTOM_Z,
         min=0.0,
     )
     bed_report: StringProperty(
@@ -221,6 +260,4 @@ class SceneProperties(PropertyGroup):
         options={"HIDDEN"},
     )
 
-    @staticmethod
-    def get_report():
-        return report.info()
+    get_report = staticmethod(report.info)
@@ -2,16 +2,18 @@
 # SPDX-FileCopyrightText: 2013-2022 Campbell Barton
 # SPDX-FileCopyrightText: 2024 Mikhail Rachinskiy
 
-_data = []
+_data = ()
 
 
 def update(*args):
-    _data[:] = args
+    global _data
+    _data = args
 
 
 def info():
-    return tuple(_data)
+    return _data
 
 
 def clear():
-    _data.clear()
+    global _data
+    _data = ()
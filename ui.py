@@ -2,7 +2,6 @@
 # SPDX-FileCopyrightText: 2013-2022 Campbell Barton
 # SPDX-FileCopyrightText: 2017-2025 Mikhail Rachinskiy
 
-import bmesh
 from bpy.app.translations import pgettext_tip as tip_
 from bpy.types import Object, Panel
 
@@ -14,6 +13,14 @@ def _is_mesh(ob: Object) -> bool:
     return ob is not None and ob.type == "MESH"
 
 
+def _props_column(col, owner, fields) -> None:
+    for prop, text in fields:
+        if text is None:
+            col.prop(owner, prop)
+        else:
+            col.prop(owner, prop, text=text)
+
+
 class Sidebar:
     bl_category = "3D Print"
     bl_space_type = "VIEW_3D"
@@ -28,31 +35,40 @@ class VIEW3D_PT_print3d_analyze(Sidebar, Panel):
     bl_label = "Analyze"
 
     _type_to_icon = {
-        bmesh.types.BMVert: "VERTEXSEL",
-        bmesh.types.BMEdge: "EDGESEL",
-        bmesh.types.BMFace: "FACESEL",
+        "BMVert": "VERTEXSEL",
+        "BMEdge": "EDGESEL",
+        "BMFace": "FACESEL",
     }
 
+    _check_rows = (
+        ("mesh.print3d_check_degenerate", "threshold_zero"),
+        ("mesh.print3d_check_nonplanar", "angle_nonplanar"),
+        ("mesh.print3d_check_thick", "thickness_min"),
+        ("mesh.print3d_check_sharp", "angle_sharp"),
+        ("mesh.print3d_check_overhang", "angle_overhang"),
+    )
+
     def draw_report(self, context):
-        layout = self.layout
         info = report.info()
+        if not info:
+            return
 
-        if info:
-            is_edit = context.edit_object is not None
+        layout = self.layout
+        is_edit = context.edit_object is not None
 
-            row = layout.row()
-            row.label(text="Result")
-            row.operator("wm.print3d_report_clear", text="", icon="X")
+        row = layout.row()
+        row.label(text="Result")
+        row.operator("wm.print3d_report_clear", text="", icon="X")
 
-            box = layout.box()
-            col = box.column()
+        box = layout.box()
+        col = box.column()
 
-            for i, (text, data) in enumerate(info):
-                if is_edit and data and data[1]:
-                    bm_type, _bm_array = data
-                    col.operator("mesh.print3d_select_report", text=text, icon=self._type_to_icon[bm_type],).index = i
-                else:
-                    col.label(text=text)
+        for i, (text, data) in enumerate(info):
+            if is_edit and data and len(data[1]):
+                bm_type, _bm_array = data
+                col.operator("mesh.print3d_select_report", text=text, icon=self._type_to_icon[bm_type.__name__],).index = i
+            else:
+                col.label(text=text)
 
     def draw(self, context):
         layout = self.layout
@@ -65,27 +81,17 @@ class VIEW3D_PT_print3d_analyze(Sidebar, Panel):
         row = layout.row(align=True)
         row.operator("mesh.print3d_info_volume", text="Volume")
         row.operator("mesh.print3d_info_area", text="Area")
+        row.operator("mesh.print3d_info_volume_area", text="Both")
 
         layout.label(text="Checks")
 
         col = layout.column(align=True)
         col.operator("mesh.print3d_check_solid")
         col.operator("mesh.print3d_check_intersect")
-        row = col.row(align=True)
-        row.operator("mesh.print3d_check_degenerate")
-        row.prop(props, "threshold_zero", text="")
-        row = col.row(align=True)
-        row.operator("mesh.print3d_check_nonplanar")
-        row.prop(props, "angle_nonplanar", text="")
-        row = col.row(align=True)
-        row.operator("mesh.print3d_check_thick")
-        row.prop(props, "thickness_min", text="")
-        row = col.row(align=True)
-        row.operator("mesh.print3d_check_sharp")
-        row.prop(props, "angle_sharp", text="")
-        row = col.row(align=True)
-        row.operator("mesh.print3d_check_overhang")
-        row.prop(props, "angle_overhang", text="")
+        for op_id, prop_id in self._check_rows:
+            row = col.row(align=True)
+            row.operator(op_id)
+            row.prop(props, prop_id, text="")
 
         layout.label(text="Orientation")
         row = layout.row(align=True)
@@ -151,17 +157,14 @@ class VIEW3D_PT_print3d_edit(Sidebar, Panel):
         op = row.operator("object.print3d_check_bed_fit", text="Auto Scale to Fit")
         op.auto_scale = True
 
-        if props.bed_report:
+        bed_report = props.bed_report
+        if bed_report:
+            overflow = dict(zip(("X:", "Y:", "Z:"), props.bed_axis_overflow))
             box = layout.box()
             box.label(text="Build Volume Report")
-            for line in props.bed_report.splitlines():
+            for line in bed_report.splitlines():
                 row = box.row()
-                if line.startswith("X:"):
-                    row.alert = props.bed_axis_overflow[0]
-                elif line.startswith("Y:"):
-                    row.alert = props.bed_axis_overflow[1]
-                elif line.startswith("Z:"):
-                    row.alert = props.bed_axis_overflow[2]
+                row.alert = overflow.get(line[:2], False)
                 row.label(text=line)
 
         layout.label(text="Scale To")
@@ -175,12 +178,23 @@ class VIEW3D_PT_print3d_export(Sidebar, Panel):
     bl_label = "Export"
     bl_options = {"DEFAULT_CLOSED"}
 
+    _geometry_fields = (
+        ("use_uv", None),
+        ("use_normals", "Normals"),
+        ("use_colors", "Colors"),
+    )
+    _3mf_fields = (
+        ("use_3mf_materials", None),
+        ("use_3mf_units", None),
+    )
+
     def draw(self, context):
         layout = self.layout
         layout.use_property_split = True
         layout.use_property_decorate = False
 
         props = context.scene.print3d_toolbox
+        export_format = props.export_format
 
         layout.prop(props, "export_path", text="")
         layout.prop(props, "export_format")
@@ -193,20 +207,17 @@ class VIEW3D_PT_print3d_export(Sidebar, Panel):
         if panel:
             col = panel.column(heading="General")
             sub = col.column()
-            sub.active = props.export_format not in {"OBJ", "3MF"}
+            sub.active = export_format not in {"OBJ", "3MF"}
             sub.prop(props, "use_ascii_format")
             col.prop(props, "use_scene_scale")
 
             col = panel.column(heading="Geometry")
-            col.active = props.export_format != "STL"
-            col.prop(props, "use_uv")
-            col.prop(props, "use_normals", text="Normals")
-            col.prop(props, "use_colors", text="Colors")
+            col.active = export_format != "STL"
+            _props_column(col, props, self._geometry_fields)
 
             col = panel.column(heading="Materials")
             col.prop(props, "use_copy_textures")
 
             col = panel.column(heading="3MF")
-            col.active = props.export_format == "3MF"
-            col.prop(props, "use_3mf_materials")
-            col.prop(props, "use_3mf_units")
+            col.active = export_format == "3MF"
+            _props_column(col, props, self._3mf_fields)